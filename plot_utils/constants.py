@@ -13,6 +13,11 @@ EXCLUSIVE_PLOTS = ('all', 'fgrp_hz', 'fgrpHz_X_t', 'gwO3Hz_X_t')
 
 ALL_INCLUSIVE = ('fgrp5', 'fgrpBG1', 'gw_O2', 'gw_O3', 'brp4', 'brp7')
 
+# Sets used in PlotTasks.manage_plots() for label membership checks; the
+#   tuples above keep the label order used when looping.
+EXCLUSIVE_SET = frozenset(EXCLUSIVE_PLOTS)
+INCLUSIVE_SET = frozenset(ALL_INCLUSIVE)
+
 # Dict used in PlotTasks.add_project_tags to fill in is_<project> columns
 #   in the main DataFrame.
 PROJECT_NAME_REGEX = {
@@ -46,7 +51,7 @@ CLICKED_PLOT = {
 SIZE = 4  # Plotted Line2D vertex marker size.
 SCALE = 1  # Adjust legend marker icon as factor of marker_size.
 DCNT_SIZE = 2  # Task daily count marker size.
-PICK_RADIUS = 6  # Radius used by set_pickradius for reports.on_pick_report().
+PICK_RADIUS = 6  # Plotted data pick radius, in points, for reports.on_pick_report().
 
 """
 Line and marker styles:
@@ -6,6 +6,7 @@ validate_datafile - Check that file starts with timestamp; exit if not.
 
 Constants:
 CFGFILE - the configuration file for setting a custom data file path.
+CACHEFILE - the Feather file of the DataFrame parsed from the data file.
 TESTFILE - Path to the sample data file to test the program's functions.
 """
 # Copyright (C) 2021-2022 C. Echt under GNU General Public License'
@@ -17,7 +18,7 @@ from re import match
 
 # Local application imports
 from plot_utils import URL
-from plot_utils.utils import MY_OS
+from plot_utils import utils
 
 CFGFILE = Path('plot_cfg.txt').resolve()
 TESTFILE = Path('plot_utils/testdata.txt')
@@ -63,16 +64,16 @@ def set_datapath(use_test_file=False) -> Path:
                 sys.exit(f"The custom path, {custom_path}, is not working.\n")
 
     # Supported system platforms have already been verified in plot_utils __init__.py.
-    elif not Path.is_file(default_datapath[MY_OS]):
+    elif not Path.is_file(default_datapath[utils.MY_OS]):
         badpath_msg = (
             '\nThe job_log data file is not in its expected default path:\n'
-            f'     {default_datapath[MY_OS]}\n'
+            f'     {default_datapath[utils.MY_OS]}\n'
             'You can enter a custom path for your job_log file in'
             f" the configuration file: {CFGFILE}.")
         sys.exit(badpath_msg)
 
-    validate_datafile(default_datapath[MY_OS])
-    return default_datapath[MY_OS]
+    validate_datafile(default_datapath[utils.MY_OS])
+    return default_datapath[utils.MY_OS]
 
 
 def validate_datafile(filepath: Path) -> None:
@@ -114,3 +115,8 @@ def valid_path_to(relative_path: str) -> Path:
     else:
         valid_path = Path(Path(__file__).parent, f'../{relative_path}').resolve()
     return valid_path
+
+
+# The cache file is kept in the program folder, wherever the program is
+#  launched from.
+CACHEFILE = valid_path_to('job_log_cache.feather')
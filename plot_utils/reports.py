@@ -13,13 +13,13 @@ view_report - Create the toplevel window to display report text.
 import sys
 
 from pathlib import Path
-from re import search
 
 # Third party imports.
 #   tkinter may not be installed in all Python distributions,
 try:
     import pandas as pd
     import tkinter as tk
+    from numpy import count_nonzero
     from tkinter.scrolledtext import ScrolledText
 
 except (ImportError, ModuleNotFoundError) as import_err:
@@ -44,16 +44,15 @@ except (ImportError, ModuleNotFoundError) as import_err:
 
 # Local application imports
 import plot_utils
-from plot_utils import (path_check,
-                        utils,
+from plot_utils import (utils,
                         constants as const,)
 
 # This exception handler is to avoid an AttributeError when reports.py
 #   is, on an off-chance, run as "__main__", and ensures that Python
 #   returns the usual, "Process finished with exit code 0".
 # The timestamp column name strings here must match those set for
-#   self.time_stamp in PlotTasks __init__.
-# manage_args() returns a 2-tuple of booleans.
+#   self.time_stamp in TaskDataFrame __init__.
+# manage_args() returns a 3-tuple (bool, bool, path).
 try:
     TIME_STAMP = 'utc_tstamp' if utils.manage_args()[1] else 'local_tstamp'
 except AttributeError:
@@ -100,19 +99,14 @@ def joblog_report(dataframe: pd) -> None:
     proj_days = []
     p_tally = []
 
-    for _p in const.PROJECTS:
-        is_proj = f'is_{_p}'
-        proj_totals.append(dataframe[is_proj].sum())
-
-        proj_dcnt = f'{_p}_Dcnt'
+    # Need to floor timestamps to their day only once; a Project's number
+    #   of days is then the number of unique days in its is_<project> rows.
+    tstamp_day = dataframe[TIME_STAMP].dt.floor('D')
 
-        proj_days.append(
-            len(dataframe[proj_dcnt]
-                .groupby(dataframe[TIME_STAMP].dt.date.where(dataframe[proj_dcnt].notnull())
-                        )
-                .unique()
-               )
-        )
+    for _p in const.PROJECTS:
+        is_proj = dataframe[f'is_{_p}'].to_numpy()
+        proj_totals.append(count_nonzero(is_proj))
+        proj_days.append(tstamp_day[is_proj].nunique())
 
         if proj_totals[-1] != 0:
             proj_daily_means.append(
@@ -120,12 +114,13 @@ def joblog_report(dataframe: pd) -> None:
         else:  # There is no Project _p in the job log.
             proj_daily_means.append(0)
 
-    # Note: utils.manage_args()[0] returns the --test command line option as boolean.
-    data_file = path_check.set_datapath(use_test_file=utils.manage_args()[0])
+    # Note: utils.manage_args()[2] returns the data file path already set
+    #   for the --test command line option.
+    data_file = utils.manage_args()[2]
 
     _results = tuple(zip(const.PROJECTS, proj_totals, proj_daily_means, proj_days))
 
-    num_days = len(pd.to_datetime(dataframe[TIME_STAMP]).dt.date.unique())
+    num_days = tstamp_day.nunique()
 
     # Example report layout: note that 'all' and Projects total may differ.
     # /var/lib/boinc/job_log_einstein.phys.uwm.edu.txt
@@ -163,7 +158,7 @@ def joblog_report(dataframe: pd) -> None:
                 text=_report, minsize=(400, 270))
 
 
-def on_pick_report(event, dataframe: pd) -> None:
+def on_pick_report(event, dataframe: pd, rows=None) -> None:
     """
     Click on plot area to show nearby task info in new figure and in
     Terminal or Command Line. Template source:
@@ -174,6 +169,9 @@ def on_pick_report(event, dataframe: pd) -> None:
     area of plotted markers. No event is triggered when a toolbar
     a navigation tool (pan or zoom) is active.
     :param dataframe: The pandas main dataframe of all job log data.
+    :param rows: Array of *dataframe* row indices for the data points
+    of the picked artist, when it plots only a Project's subset of
+    rows (default: None, the artist plots every row).
     :return: None
     """
 
@@ -187,30 +185,33 @@ def on_pick_report(event, dataframe: pd) -> None:
     task_info_list = [_header]
 
     # VertexSelector(line), in matplotlib.lines; list of df indices included in
-    #   set_pickradius().
+    #   the plotted line's pick radius.
     _n = len(event.ind)
     if not _n:
         print('event.ind is undefined')
         return event
 
-    # Need to limit tasks from total included in set_pickradius(const.PICK_RADIUS)
-    #   from PlotTasks.setup_count_axes().
+    task_idx = event.ind if rows is None else rows[event.ind]
+
+    # Need to limit tasks from total included in the pick radius, set with
+    #   picker=const.PICK_RADIUS in the PlotTasks plot methods.
+    # The reported rows are gathered in one lookup, then read as tuples,
+    #   instead of with a scalar lookup for each value.
     report_limit = 6
-    for dataidx in event.ind:
-        if report_limit > 0:
-            task_info_list.append(
-                f'{dataframe.loc[dataidx][TIME_STAMP]} | '
-                f'{dataframe.loc[dataidx].task_name} | '
-                f'{dataframe.loc[dataidx].elapsed_t.time()}')
-        report_limit -= 1
+    picked_tasks = dataframe.loc[task_idx[:report_limit],
+                                 [TIME_STAMP, 'task_name', 'elapsed_t']]
+    for tstamp, task_name, elapsed_t in picked_tasks.itertuples(index=False, name=None):
+        task_info_list.append(f'{tstamp} | {task_name} | {elapsed_t.time()}')
 
     # Add something special; count the number of tasks reported for
     #   a Project since the datetime timestamp of the nearest task.
-    dt_since = dataframe.loc[event.ind[0]][TIME_STAMP]
-    _name = dataframe.loc[event.ind[0]].task_name
+    # The task's Project is the last one in const.PROJECT_NAME_REGEX
+    #   that is flagged for it in the is_<project> columns; these flags
+    #   were set from those regex matches to the task name.
+    dt_since = dataframe.at[task_idx[0], TIME_STAMP]
     project = ''
-    for proj, regex in project_groups.PROJECT_NAME_REGEX.items():
-        if search(regex, _name):
+    for proj in const.PROJECT_NAME_REGEX:
+        if dataframe.at[task_idx[0], f'is_{proj}']:
             project = proj
 
     num_since = number_since(dataframe, project, dt_since)
@@ -249,7 +250,9 @@ def number_since(dataframe: pd, proj: str, since_date: str) -> int:
      *since_date*.
     """
     since_dt = pd.to_datetime(since_date)
-    return dataframe.loc[dataframe[TIME_STAMP] >= since_dt, f'is_{proj}'].sum()
+    is_since = dataframe[TIME_STAMP].to_numpy() >= since_dt.to_datetime64()
+
+    return count_nonzero(dataframe[f'is_{proj}'].to_numpy() & is_since)
 
 def view_report(title: str, text: str, minsize: tuple, scroll=False) -> None:
     """
@@ -14,6 +14,7 @@ import sys
 import tkinter as tk
 
 from datetime import datetime
+from functools import lru_cache
 
 # Third party imports.
 import matplotlib.pyplot as plt
@@ -97,12 +98,16 @@ def set_icon(mainloop: tk.Tk) -> None:
               'The program will run without a custom icon image.')
 
 
+@lru_cache(maxsize=None)
 def manage_args() -> tuple:
     """
     Allow handling of command line arguments. The --about information
     can also be accessed from the GUI as a pop-up window.
+    The result is cached, so command line arguments are parsed, and the
+    data file path is set and validated, only on the first call.
 
-    :return: Tuple of booleans for --test and --utc options (default: False).
+    :return: Tuple of booleans for --test and --utc options (default: False),
+        and the Path of the data file.
     """
 
     parser = argparse.ArgumentParser()